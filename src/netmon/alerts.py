@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import random
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import TYPE_CHECKING
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
@@ -25,7 +28,7 @@ class AlertBackend(ABC):
     """Base class for alert backends."""
 
     @abstractmethod
-    def send(self, title: str, message: str, priority: str = "default") -> bool:
+    async def send(self, title: str, message: str, priority: str = "default") -> bool:
         """Send an alert.
 
         Args:
@@ -38,30 +41,102 @@ class AlertBackend(ABC):
         """
         ...
 
+    async def close(self) -> None:
+        """Release any resources held by the backend."""
 
-class WebhookBackend(AlertBackend):
+
+class HttpAlertBackend(AlertBackend):
+    """Base class for backends that deliver alerts over HTTP.
+
+    A single pooled client is kept per backend so repeated alerts reuse
+    the same connection instead of paying a new TCP/TLS handshake each time.
+    Transient failures are retried a bounded number of times with jittered
+    exponential backoff.
+    """
+
+    MAX_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 0.25
+    RETRY_MAX_DELAY = 4.0
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(self) -> None:
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def _post(self, url: str, **kwargs: Any) -> bool:
+        """POST to the endpoint, retrying transient failures.
+
+        Returns:
+            True if the endpoint eventually accepted the request
+        """
+        for attempt in range(self.MAX_ATTEMPTS):
+            retry_after = None
+            try:
+                response = await self._client.post(url, **kwargs)
+                if response.is_success:
+                    return True
+                if response.status_code not in self.RETRY_STATUS_CODES:
+                    return False
+                if response.status_code in (429, 503):
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            except httpx.HTTPError:
+                pass
+
+            if retry_after is not None and retry_after > self.RETRY_MAX_DELAY:
+                # Retrying before the server's deadline would only add load
+                return False
+
+            if attempt + 1 < self.MAX_ATTEMPTS:
+                await asyncio.sleep(self._retry_delay(attempt, retry_after))
+
+        return False
+
+    def _retry_delay(self, attempt: int, retry_after: float | None) -> float:
+        """Compute the delay before the next attempt.
+
+        A server-provided Retry-After is honored in full; callers give up
+        instead when it exceeds RETRY_MAX_DELAY.
+        """
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2**attempt)
+        return delay * random.uniform(0.5, 1.5)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class WebhookBackend(HttpAlertBackend):
     """Generic webhook alert backend."""
 
     def __init__(self, url: str) -> None:
+        super().__init__()
         self._url = url
 
-    def send(self, title: str, message: str, priority: str = "default") -> bool:
-        try:
-            response = httpx.post(
-                self._url,
-                json={
-                    "title": title,
-                    "message": message,
-                    "priority": priority,
-                },
-                timeout=10.0,
-            )
-            return response.is_success
-        except httpx.HTTPError:
-            return False
+    async def send(self, title: str, message: str, priority: str = "default") -> bool:
+        return await self._post(
+            self._url,
+            json={
+                "title": title,
+                "message": message,
+                "priority": priority,
+            },
+        )
 
 
-class NtfyBackend(AlertBackend):
+class NtfyBackend(HttpAlertBackend):
     """ntfy.sh alert backend."""
 
     PRIORITY_MAP = {
@@ -72,26 +147,23 @@ class NtfyBackend(AlertBackend):
     }
 
     def __init__(self, url: str) -> None:
+        super().__init__()
         self._url = url.rstrip("/")
-
-    def send(self, title: str, message: str, priority: str = "default") -> bool:
-        try:
-            response = httpx.post(
-                self._url,
-                data=message.encode("utf-8"),
-                headers={
-                    "Title": title,
-                    "Priority": self.PRIORITY_MAP.get(priority, "3"),
-                    "Tags": "docker,network,warning",
-                },
-                timeout=10.0,
-            )
-            return response.is_success
-        except httpx.HTTPError:
-            return False
+        self._base_headers = {"Tags": "docker,network,warning"}
+
+    async def send(self, title: str, message: str, priority: str = "default") -> bool:
+        return await self._post(
+            self._url,
+            data=message.encode("utf-8"),
+            headers={
+                **self._base_headers,
+                "Title": title,
+                "Priority": self.PRIORITY_MAP.get(priority, "3"),
+            },
+        )
 
 
-class GotifyBackend(AlertBackend):
+class GotifyBackend(HttpAlertBackend):
     """Gotify alert backend."""
 
     PRIORITY_MAP = {
@@ -102,31 +174,51 @@ class GotifyBackend(AlertBackend):
     }
 
     def __init__(self, url: str, token: str) -> None:
+        super().__init__()
         self._url = url.rstrip("/")
-        self._token = token
-
-    def send(self, title: str, message: str, priority: str = "default") -> bool:
-        try:
-            response = httpx.post(
-                f"{self._url}/message",
-                params={"token": self._token},
-                json={
-                    "title": title,
-                    "message": message,
-                    "priority": self.PRIORITY_MAP.get(priority, 5),
-                },
-                timeout=10.0,
-            )
-            return response.is_success
-        except httpx.HTTPError:
-            return False
+        self._message_url = f"{self._url}/message"
+        self._params = {"token": token}
+
+    async def send(self, title: str, message: str, priority: str = "default") -> bool:
+        return await self._post(
+            self._message_url,
+            params=self._params,
+            json={
+                "title": title,
+                "message": message,
+                "priority": self.PRIORITY_MAP.get(priority, 5),
+            },
+        )
 
 
 class AlertDispatcher:
-    """Dispatches alerts through configured backends."""
+    """Dispatches alerts through configured backends.
+
+    Alerts are fanned out to all backends concurrently, so total delivery
+    time is bounded by the slowest backend rather than the sum of all of them.
 
-    def __init__(self, backend: AlertBackend | None = None) -> None:
-        self._backend = backend
+    Conflict alerts can be coalesced: reports arriving within the window are
+    merged and a single alert is sent for the latest one when it closes.
+    """
+
+    DEFAULT_COALESCE_SECONDS = 3.0
+
+    def __init__(self, *backends: AlertBackend, coalesce_seconds: float = 0.0) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            backends: Backends to deliver alerts through
+            coalesce_seconds: Window for merging rapid-fire conflict alerts (0 disables)
+        """
+        self._backends = list(backends)
+        self._coalesce_seconds = coalesce_seconds
+        self._pending_report: ConflictReport | None = None
+
+    async def __aenter__(self) -> AlertDispatcher:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
 
     @classmethod
     def from_env(cls) -> AlertDispatcher:
@@ -136,62 +228,120 @@ class AlertDispatcher:
             NETMON_ALERT_URL: Alert endpoint URL
             NETMON_ALERT_TYPE: Backend type (webhook, ntfy, gotify)
             NETMON_GOTIFY_TOKEN: Token for Gotify (required if type is gotify)
+
+        Raises:
+            ValueError: If NETMON_ALERT_TYPE is not a supported backend type
         """
-        url = os.environ.get("NETMON_ALERT_URL")
+        env = os.environ
+        url = env.get("NETMON_ALERT_URL", "").strip()
         if not url:
-            return cls(None)
+            return cls()
 
-        alert_type = os.environ.get("NETMON_ALERT_TYPE", "webhook").lower()
+        raw_type = env.get("NETMON_ALERT_TYPE", "").strip().lower() or AlertType.WEBHOOK.value
+        try:
+            alert_type = AlertType(raw_type)
+        except ValueError:
+            supported = ", ".join(t.value for t in AlertType)
+            raise ValueError(
+                f"Unknown NETMON_ALERT_TYPE '{raw_type}' (expected one of: {supported})"
+            ) from None
 
         backend: AlertBackend
-        if alert_type == "ntfy":
+        if alert_type is AlertType.NTFY:
             backend = NtfyBackend(url)
-        elif alert_type == "gotify":
-            token = os.environ.get("NETMON_GOTIFY_TOKEN", "")
-            backend = GotifyBackend(url, token)
+        elif alert_type is AlertType.GOTIFY:
+            backend = GotifyBackend(url, env.get("NETMON_GOTIFY_TOKEN", "").strip())
         else:
             backend = WebhookBackend(url)
 
-        return cls(backend)
+        return cls(backend, coalesce_seconds=cls.DEFAULT_COALESCE_SECONDS)
 
     @property
     def is_configured(self) -> bool:
         """Check if alerting is configured."""
-        return self._backend is not None
+        return bool(self._backends)
+
+    async def send_conflict_alert(self, report: ConflictReport) -> bool | None:
+        """Send an alert about detected conflicts.
 
-    def send_conflict_alert(self, report: ConflictReport) -> bool:
-        """Send an alert about detected conflicts."""
-        if not self._backend or not report.has_conflicts:
+        Each report is a full scan, so merging keeps only the latest one.
+        Reports without conflicts are ignored and never replace a pending one.
+
+        Returns:
+            True if the alert was sent, False if there was nothing to send or
+            delivery failed, or None if the report was merged into an alert
+            that is already pending
+        """
+        if not self._backends or not report.has_conflicts:
             return False
 
-        title = "Docker Network Conflicts Detected"
+        if self._coalesce_seconds <= 0:
+            return await self._send_report(report)
+
+        if self._pending_report is not None:
+            self._pending_report = report
+            return None
 
-        lines = [f"Found {len(report.conflicts)} conflict(s):"]
-        if report.critical_count > 0:
-            lines.append(f"  - {report.critical_count} CRITICAL")
-        if report.high_count > 0:
-            lines.append(f"  - {report.high_count} HIGH")
-        if report.warning_count > 0:
-            lines.append(f"  - {report.warning_count} WARNING")
+        self._pending_report = report
+        try:
+            await asyncio.sleep(self._coalesce_seconds)
+        finally:
+            report, self._pending_report = self._pending_report, None
+
+        return await self._send_report(report)
 
-        lines.append("")
-        lines.append("Top issues:")
-        for conflict in report.conflicts[:5]:
-            lines.append(f"  [{conflict.severity.value}] {conflict.dns_name} on {conflict.network}")
+    async def _send_report(self, report: ConflictReport) -> bool:
+        """Format and send a single conflict alert."""
+        if not report.has_conflicts:
+            return False
 
-        message = "\n".join(lines)
+        title = "Docker Network Conflicts Detected"
+
+        counts = "\n".join(
+            f"  - {count} {label}"
+            for count, label in (
+                (report.critical_count, "CRITICAL"),
+                (report.high_count, "HIGH"),
+                (report.warning_count, "WARNING"),
+            )
+            if count > 0
+        )
+        top_issues = "\n".join(
+            f"  [{c.severity.label}] {c.dns_name} on {c.network}"
+            for c in islice(report.conflicts, 5)
+        )
+        message = (
+            f"Found {len(report.conflicts)} conflict(s):\n{counts}\n\n"
+            f"Top issues:\n{top_issues}"
+        )
 
         priority = "urgent" if report.critical_count > 0 else "high" if report.high_count > 0 else "default"
 
-        return self._backend.send(title, message, priority)
+        return await self._send(title, message, priority)
+
+    async def close(self) -> None:
+        """Close the underlying backend connections."""
+        await asyncio.gather(*(backend.close() for backend in self._backends))
 
-    def send_test_alert(self) -> bool:
+    async def send_test_alert(self) -> bool:
         """Send a test alert to verify configuration."""
-        if not self._backend:
+        if not self._backends:
             return False
 
-        return self._backend.send(
+        return await self._send(
             title="Docker Network Monitor Test",
             message="This is a test alert from docker-netmon.",
             priority="low",
         )
+
+    async def _send(self, title: str, message: str, priority: str) -> bool:
+        """Send an alert through all backends concurrently.
+
+        Returns:
+            True if at least one backend delivered the alert
+        """
+        results = await asyncio.gather(
+            *(backend.send(title, message, priority) for backend in self._backends),
+            return_exceptions=True,
+        )
+        return any(result is True for result in results)
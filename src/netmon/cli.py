@@ -3,17 +3,17 @@
 from __future__ import annotations
 
 import sys
+from typing import TYPE_CHECKING
 
 import click
 from rich.console import Console
 
 from netmon import __version__
-from netmon.alerts import AlertDispatcher
-from netmon.conflicts import ConflictDetector
-from netmon.docker_client import DockerClient
-from netmon.monitor import EventMonitor
-from netmon.scanner import NetworkScanner
-from netmon.visualizer import NetworkVisualizer
+
+if TYPE_CHECKING:
+    from netmon.alerts import AlertDispatcher
+    from netmon.docker_client import DockerClient
+    from netmon.monitor import EventMonitor
 
 
 console = Console()
@@ -21,6 +21,8 @@ console = Console()
 
 def get_client() -> DockerClient:
     """Get Docker client or exit with error."""
+    from netmon.docker_client import DockerClient
+
     try:
         return DockerClient()
     except ConnectionError as e:
@@ -29,6 +31,17 @@ def get_client() -> DockerClient:
         sys.exit(1)
 
 
+def get_dispatcher() -> AlertDispatcher:
+    """Get the alert dispatcher or exit with error."""
+    from netmon.alerts import AlertDispatcher
+
+    try:
+        return AlertDispatcher.from_env()
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+
 @click.group()
 @click.version_option(version=__version__, prog_name="netmon")
 def main() -> None:
@@ -65,6 +78,10 @@ def scan(
     quiet: bool,
 ) -> None:
     """Scan Docker networks for DNS conflicts."""
+    from netmon.conflicts import ConflictDetector
+    from netmon.scanner import NetworkScanner
+    from netmon.visualizer import NetworkVisualizer
+
     client = get_client()
 
     try:
@@ -106,6 +123,10 @@ def scan(
 )
 def map(include_default: bool) -> None:
     """Display network topology as ASCII tree."""
+    from netmon.conflicts import ConflictDetector
+    from netmon.scanner import NetworkScanner
+    from netmon.visualizer import NetworkVisualizer
+
     client = get_client()
 
     try:
@@ -139,14 +160,27 @@ def map(include_default: bool) -> None:
     is_flag=True,
     help="Skip initial scan on startup",
 )
-def watch(no_warnings: bool, no_initial_scan: bool) -> None:
+@click.option(
+    "--label",
+    "-l",
+    "labels",
+    multiple=True,
+    help="Only react to events from objects with this label (key or key=value)",
+)
+def watch(no_warnings: bool, no_initial_scan: bool, labels: tuple[str, ...]) -> None:
     """Monitor Docker events and alert on conflicts."""
+    import asyncio
+
+    from netmon.conflicts import ConflictDetector
+    from netmon.monitor import EventMonitor
+    from netmon.scanner import NetworkScanner
+
+    dispatcher = get_dispatcher()
     client = get_client()
 
     try:
         scanner = NetworkScanner(client)
         detector = ConflictDetector(warn_generic_names=not no_warnings)
-        dispatcher = AlertDispatcher.from_env()
 
         if not dispatcher.is_configured:
             console.print(
@@ -161,18 +195,29 @@ def watch(no_warnings: bool, no_initial_scan: bool) -> None:
             detector=detector,
             dispatcher=dispatcher,
             console=console,
+            event_labels=list(labels) or None,
         )
 
-        monitor.start(show_initial_scan=not no_initial_scan)
+        asyncio.run(_run_monitor(monitor, dispatcher, show_initial_scan=not no_initial_scan))
 
     finally:
         client.close()
 
 
+async def _run_monitor(
+    monitor: EventMonitor, dispatcher: AlertDispatcher, show_initial_scan: bool
+) -> None:
+    """Run the event monitor, closing the dispatcher's connections on exit."""
+    async with dispatcher:
+        await monitor.start(show_initial_scan=show_initial_scan)
+
+
 @main.command()
 def test_alert() -> None:
     """Send a test alert to verify alerting configuration."""
-    dispatcher = AlertDispatcher.from_env()
+    import asyncio
+
+    dispatcher = get_dispatcher()
 
     if not dispatcher.is_configured:
         console.print("[red]Error:[/red] No alert URL configured")
@@ -181,13 +226,19 @@ def test_alert() -> None:
 
     console.print("Sending test alert...")
 
-    if dispatcher.send_test_alert():
+    if asyncio.run(_send_test_alert(dispatcher)):
         console.print("[green]Test alert sent successfully[/green]")
     else:
         console.print("[red]Failed to send test alert[/red]")
         sys.exit(1)
 
 
+async def _send_test_alert(dispatcher: AlertDispatcher) -> bool:
+    """Send a test alert, closing the dispatcher's connections afterwards."""
+    async with dispatcher:
+        return await dispatcher.send_test_alert()
+
+
 @main.command()
 @click.option(
     "--port",
@@ -2,22 +2,35 @@
 
 from __future__ import annotations
 
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
+from functools import cached_property
 from typing import TYPE_CHECKING
 
-from netmon.scanner import DnsNameSource, get_all_dns_names, get_dns_name_entries
+from netmon.scanner import DnsNameSource, get_dns_name_entries
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from netmon.scanner import DnsNameEntry, NetworkNode, NetworkTopology
 
 
-class Severity(Enum):
-    """Conflict severity levels."""
+class Severity(IntEnum):
+    """Conflict severity levels.
+
+    Values are ordered so that a lower value is more severe, letting
+    severities be compared and sorted directly.
+    """
 
-    CRITICAL = "critical"
-    HIGH = "high"
-    WARNING = "warning"
+    CRITICAL = 0
+    HIGH = 1
+    WARNING = 2
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used in reports and the JSON API."""
+        return self.name.lower()
 
 
 GENERIC_NAMES = frozenset(
@@ -53,7 +66,7 @@ GENERIC_NAMES = frozenset(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ConflictingName:
     """Details about a name involved in a conflict."""
 
@@ -61,7 +74,7 @@ class ConflictingName:
     source: str  # "container name", "service name", or "alias"
 
 
-@dataclass
+@dataclass(slots=True)
 class Conflict:
     """A detected DNS naming conflict."""
 
@@ -87,17 +100,39 @@ class ConflictReport:
     total_networks: int
     total_containers: int
 
+    @cached_property
+    def _severity_counts(self) -> Counter[Severity]:
+        """Tally conflicts by severity in a single pass."""
+        return Counter(c.severity for c in self.conflicts)
+
+    @cached_property
+    def conflict_lookup(self) -> dict[str, dict[str, Conflict]]:
+        """Most severe conflict per network and DNS name, built once per report.
+
+        Nested by network so per-container loops can fetch their network's
+        table once and then probe it by DNS name alone. Names are keyed in
+        lowercase, matching get_all_dns_names().
+        """
+        lookup: defaultdict[str, dict[str, Conflict]] = defaultdict(dict)
+        for conflict in self.conflicts:
+            network_lookup = lookup[conflict.network]
+            key = conflict.dns_name.lower()
+            existing = network_lookup.get(key)
+            if existing is None or conflict.severity < existing.severity:
+                network_lookup[key] = conflict
+        return dict(lookup)
+
     @property
     def critical_count(self) -> int:
-        return sum(1 for c in self.conflicts if c.severity == Severity.CRITICAL)
+        return self._severity_counts[Severity.CRITICAL]
 
     @property
     def high_count(self) -> int:
-        return sum(1 for c in self.conflicts if c.severity == Severity.HIGH)
+        return self._severity_counts[Severity.HIGH]
 
     @property
     def warning_count(self) -> int:
-        return sum(1 for c in self.conflicts if c.severity == Severity.WARNING)
+        return self._severity_counts[Severity.WARNING]
 
     @property
     def has_conflicts(self) -> bool:
@@ -122,100 +157,96 @@ class ConflictDetector:
         for network_name, nodes in topology.networks.items():
             conflicts.extend(self._check_network(network_name, nodes))
 
-        total_containers = len(
-            {node.container_id for nodes in topology.networks.values() for node in nodes}
-        )
-
         return ConflictReport(
             conflicts=conflicts,
             total_networks=len(topology.networks),
-            total_containers=total_containers,
+            total_containers=topology.unique_container_count,
         )
 
     def _check_network(self, network_name: str, nodes: list[NetworkNode]) -> list[Conflict]:
         """Check a single network for conflicts."""
+        # Both duplicate names and generic-name warnings need a shared network
+        if len(nodes) < 2:
+            return []
+
         conflicts = []
 
-        # Map DNS name -> list of (node, DnsNameEntry)
-        dns_name_to_entries: dict[str, list[tuple[NetworkNode, DnsNameEntry]]] = {}
+        # Map lowercase DNS name -> list of (node, DnsNameEntry)
+        dns_name_to_entries: defaultdict[str, list[tuple[NetworkNode, DnsNameEntry]]] = (
+            defaultdict(list)
+        )
+
+        # Generic names are picked out while bucketing so the warning pass
+        # only visits candidate entries
+        generic_entries: list[tuple[NetworkNode, DnsNameEntry]] = []
 
         for node in nodes:
             for entry in get_dns_name_entries(node):
-                if entry.name not in dns_name_to_entries:
-                    dns_name_to_entries[entry.name] = []
-                dns_name_to_entries[entry.name].append((node, entry))
+                dns_name_to_entries[entry.key].append((node, entry))
+                if entry.key in GENERIC_NAMES:
+                    generic_entries.append((node, entry))
+
+        # DNS names on this network that already have a conflict reported
+        flagged: set[str] = set()
 
-        for dns_name, entries in dns_name_to_entries.items():
+        for key, entries in dns_name_to_entries.items():
             if len(entries) > 1:
                 unique_containers = {node.container_id for node, _ in entries}
                 if len(unique_containers) > 1:
                     conflicts.append(
-                        self._create_duplicate_conflict(network_name, dns_name, entries)
+                        self._create_duplicate_conflict(network_name, entries)
                     )
+                    flagged.add(key)
 
-        if self._warn_generic and len(nodes) > 1:
-            for node in nodes:
-                for entry in get_dns_name_entries(node):
-                    if entry.name.lower() in GENERIC_NAMES:
-                        existing = [
-                            c for c in conflicts if c.dns_name == entry.name and c.network == network_name
-                        ]
-                        if not existing:
-                            conflicts.append(
-                                self._create_generic_name_warning(network_name, entry, node)
-                            )
+        if self._warn_generic:
+            for node, entry in generic_entries:
+                if entry.key not in flagged:
+                    conflicts.append(self._create_generic_name_warning(network_name, entry, node))
+                    flagged.add(entry.key)
 
         return conflicts
 
     def _create_duplicate_conflict(
-        self, network: str, dns_name: str, entries: list[tuple[NetworkNode, DnsNameEntry]]
+        self, network: str, entries: list[tuple[NetworkNode, DnsNameEntry]]
     ) -> Conflict:
-        """Create a conflict for duplicate DNS names."""
-        # Get unique nodes
-        unique_nodes = []
-        seen_ids = set()
-        for node, _ in entries:
-            if node.container_id not in seen_ids:
-                unique_nodes.append(node)
-                seen_ids.add(node.container_id)
+        """Create a conflict for duplicate DNS names.
 
-        # Build detailed conflicting names list
-        conflicting_names = []
-        seen_container_ids = set()
+        The name is reported as first spelled among the entries, which all
+        share the same lowercase key.
+        """
+        first_entry = entries[0][1]
+        dns_name = first_entry.name
+        unique_nodes: list[NetworkNode] = []
+        conflicting_names: list[ConflictingName] = []
+        source_descriptions: list[str] = []
+        sources: set[DnsNameSource] = set()
+        unique_ids: set[str] = set()
+        is_exact_name_match = True
+
+        # Single pass: the first entry for each container defines its conflicting name
         for node, entry in entries:
-            if node.container_id not in seen_container_ids:
+            sources.add(entry.source)
+            source_descriptions.append(f"'{node.container_name}' ({entry.source.value})")
+            if node.container_id not in unique_ids:
+                unique_ids.add(node.container_id)
+                unique_nodes.append(node)
                 conflicting_names.append(ConflictingName(
                     container_name=node.container_name,
                     source=entry.source.value,
                 ))
-                seen_container_ids.add(node.container_id)
-
-        # Determine severity based on source types
-        sources = {entry.source for _, entry in entries}
-        is_exact_name_match = all(node.container_name == dns_name for node in unique_nodes)
+                if is_exact_name_match and node.container_name.lower() != first_entry.key:
+                    is_exact_name_match = False
 
+        # Critical when every container is reached by its own container name
         if is_exact_name_match:
             severity = Severity.CRITICAL
         else:
             severity = Severity.HIGH
 
-        # Build detailed description showing sources
-        source_descriptions = []
-        for node, entry in entries:
-            if node.container_id in {n.container_id for n in unique_nodes}:
-                source_descriptions.append(f"'{node.container_name}' ({entry.source.value})")
-
-        # Remove duplicates while preserving order
-        seen_desc = set()
-        unique_source_descriptions = []
-        for desc in source_descriptions:
-            if desc not in seen_desc:
-                unique_source_descriptions.append(desc)
-                seen_desc.add(desc)
-
+        # Remove duplicate descriptions while preserving order
         description = (
             f"DNS name '{dns_name}' resolves to multiple containers: "
-            f"{', '.join(unique_source_descriptions)}"
+            f"{', '.join(dict.fromkeys(source_descriptions))}"
         )
 
         remediation = self._get_duplicate_remediation(network, dns_name, unique_nodes, sources)
@@ -326,19 +357,17 @@ class ConflictDetector:
         )
 
 
-def find_cross_network_conflicts(topology: NetworkTopology) -> list[tuple[str, list[str]]]:
+def find_cross_network_conflicts(
+    topology: NetworkTopology,
+) -> Iterator[tuple[str, list[str]]]:
     """Find containers with the same name on multiple networks.
 
     This isn't necessarily a conflict, but can indicate potential issues
     if those networks get connected.
 
-    Returns:
-        List of (container_name, networks) tuples
+    Yields:
+        (container_name, networks) tuples, with networks in scan order
     """
-    multi_network_containers = []
-
     for container_name, networks in topology.containers.items():
         if len(networks) > 1:
-            multi_network_containers.append((container_name, sorted(networks)))
-
-    return multi_network_containers
+            yield container_name, list(networks)
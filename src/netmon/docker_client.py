@@ -2,20 +2,20 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-import docker
-from docker.errors import DockerException
-
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterator
 
     from docker.models.containers import Container
-    from docker.models.networks import Network
 
 
-@dataclass
+DEFAULT_NETWORKS = frozenset({"bridge", "host", "none"})
+
+
+@dataclass(slots=True)
 class ContainerInfo:
     """Simplified container information for network analysis."""
 
@@ -26,7 +26,7 @@ class ContainerInfo:
     networks: dict[str, NetworkAttachment]
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkAttachment:
     """Container's attachment to a specific network."""
 
@@ -50,119 +50,148 @@ class NetworkInfo:
 class DockerClient:
     """Wrapper around Docker SDK for network monitoring."""
 
+    # Stays below docker-py's default connection pool size of 10
+    MAX_FETCH_WORKERS = 8
+
     def __init__(self) -> None:
+        # The Docker SDK is imported on first use to keep CLI startup fast
+        import docker
+        from docker.errors import DockerException
+
         try:
             self._client = docker.from_env()
             self._client.ping()
         except DockerException as e:
             raise ConnectionError(f"Failed to connect to Docker: {e}") from e
 
-    def get_networks(self, include_default: bool = False) -> list[NetworkInfo]:
-        """Get all Docker networks with their connected containers.
+    def iter_attachments(
+        self, include_default: bool = False
+    ) -> Iterator[tuple[ContainerInfo, NetworkAttachment]]:
+        """Yield every (container, attachment) pair on the listed networks.
+
+        Attachments are taken straight from each container's network
+        settings, which already carry the network name, IP and aliases.
 
         Args:
             include_default: Include default networks (bridge, host, none)
         """
-        default_networks = {"bridge", "host", "none"}
-        networks: list[Network] = self._client.networks.list()
-
-        result = []
-        for network in networks:
-            if not include_default and network.name in default_networks:
-                continue
-
-            network.reload()
-            containers = self._get_containers_on_network(network)
-
-            result.append(
-                NetworkInfo(
-                    id=network.id,
-                    name=network.name,
-                    driver=network.attrs.get("Driver", "unknown"),
-                    scope=network.attrs.get("Scope", "unknown"),
-                    containers=containers,
-                )
-            )
+        network_ids = {network["Id"] for network in self._list_networks(include_default)}
 
-        return result
-
-    def _get_containers_on_network(self, network: Network) -> list[ContainerInfo]:
-        """Extract container information from a network."""
-        containers = []
-        network_containers = network.attrs.get("Containers", {})
-
-        for container_id, container_data in network_containers.items():
-            try:
-                container: Container = self._client.containers.get(container_id)
-                container_info = self._build_container_info(container, network, container_data)
-                containers.append(container_info)
-            except docker.errors.NotFound:
-                continue
-
-        return containers
-
-    def _build_container_info(
-        self, container: Container, network: Network, network_data: dict
-    ) -> ContainerInfo:
-        """Build ContainerInfo from container and network data."""
-        container_networks = {}
-
-        for net_name, net_config in container.attrs.get("NetworkSettings", {}).get(
-            "Networks", {}
-        ).items():
-            aliases = net_config.get("Aliases", []) or []
-            container_networks[net_name] = NetworkAttachment(
-                network_id=net_config.get("NetworkID", ""),
-                network_name=net_name,
-                ip_address=net_config.get("IPAddress", ""),
-                aliases=[a for a in aliases if a != container.id[:12]],
-            )
+        for container in self.get_all_containers():
+            for attachment in container.networks.values():
+                if attachment.network_id in network_ids:
+                    yield container, attachment
+
+    def _list_networks(self, include_default: bool) -> list[dict]:
+        """List raw network records, optionally excluding the default networks."""
+        network_filters = None if include_default else {"type": "custom"}
+        networks: list[dict] = self._client.api.networks(filters=network_filters)
+        if include_default:
+            return networks
+        return [network for network in networks if network["Name"] not in DEFAULT_NETWORKS]
+
+    def get_network(self, network_id: str) -> NetworkInfo | None:
+        """Get a single network with its connected containers.
+
+        Only the network and its own containers are fetched, which is much
+        cheaper than a full listing when a single network changed.
+
+        Args:
+            network_id: Network ID or name
+
+        Returns:
+            The network, or None if it no longer exists
+        """
+        from docker.errors import NotFound
 
+        try:
+            network = self._client.api.inspect_network(network_id)
+        except NotFound:
+            return None
+
+        containers = [
+            self._build_container_info(container)
+            for container in self._fetch_containers(list(network.get("Containers") or {}))
+        ]
+
+        return NetworkInfo(
+            id=network["Id"],
+            name=network["Name"],
+            driver=network.get("Driver", "unknown"),
+            scope=network.get("Scope", "unknown"),
+            containers=containers,
+        )
+
+    def _fetch_containers(self, container_ids: list[str]) -> list[Container]:
+        """Inspect containers concurrently, skipping any that no longer exist.
+
+        Each inspect is an independent round-trip to the daemon, so they are
+        spread over a small thread pool.
+        """
+        if not container_ids:
+            return []
+
+        workers = min(self.MAX_FETCH_WORKERS, len(container_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            containers = executor.map(self._get_container, container_ids)
+            return [container for container in containers if container is not None]
+
+    def _get_container(self, container_id: str) -> Container | None:
+        """Inspect a single container, or None if it has gone away."""
+        from docker.errors import NotFound
+
+        try:
+            return self._client.containers.get(container_id)
+        except NotFound:
+            return None
+
+    def _build_container_info(self, container: Container) -> ContainerInfo:
+        """Build ContainerInfo from container data."""
         return ContainerInfo(
             id=container.id,
             name=container.name,
             short_id=container.short_id,
             labels=container.labels or {},
-            networks=container_networks,
+            networks=self._attachments_from_container(container),
         )
 
+    def _attachments_from_container(self, container: Container) -> dict[str, NetworkAttachment]:
+        """Extract a container's network attachments, keyed by network name."""
+        attrs = container.attrs
+        networks = (attrs.get("NetworkSettings") or {}).get("Networks") or {}
+        short_id = container.short_id
+
+        return {
+            net_name: NetworkAttachment(
+                network_id=net_config.get("NetworkID", ""),
+                network_name=net_name,
+                ip_address=net_config.get("IPAddress", ""),
+                aliases=[a for a in net_config.get("Aliases") or () if a != short_id],
+            )
+            for net_name, net_config in networks.items()
+        }
+
     def get_all_containers(self) -> list[ContainerInfo]:
         """Get all running containers with their network information."""
-        containers: list[Container] = self._client.containers.list()
-        result = []
-
-        for container in containers:
-            container_networks = {}
-
-            for net_name, net_config in container.attrs.get("NetworkSettings", {}).get(
-                "Networks", {}
-            ).items():
-                aliases = net_config.get("Aliases", []) or []
-                container_networks[net_name] = NetworkAttachment(
-                    network_id=net_config.get("NetworkID", ""),
-                    network_name=net_name,
-                    ip_address=net_config.get("IPAddress", ""),
-                    aliases=[a for a in aliases if a != container.id[:12]],
-                )
-
-            result.append(
-                ContainerInfo(
-                    id=container.id,
-                    name=container.name,
-                    short_id=container.short_id,
-                    labels=container.labels or {},
-                    networks=container_networks,
-                )
-            )
+        container_ids = [container.id for container in self._client.containers.list(sparse=True)]
+        return [
+            self._build_container_info(container)
+            for container in self._fetch_containers(container_ids)
+        ]
 
-        return result
+    def watch_events(self, labels: list[str] | None = None) -> Generator[dict, None, None]:
+        """Watch Docker events for container and network changes.
 
-    def watch_events(self) -> Generator[dict, None, None]:
-        """Watch Docker events for container and network changes."""
+        Args:
+            labels: Only stream events for objects carrying these labels
+                ("key" or "key=value"); filtered by the daemon
+        """
         event_filters = {
             "type": ["container", "network"],
             "event": ["start", "stop", "die", "connect", "disconnect"],
         }
+        if labels:
+            event_filters["label"] = labels
 
         for event in self._client.events(decode=True, filters=event_filters):
             yield event
@@ -2,20 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import signal
-import sys
 import time
 from typing import TYPE_CHECKING
 
 from rich.console import Console
 
-from netmon.conflicts import ConflictDetector
-from netmon.docker_client import DockerClient
-from netmon.scanner import NetworkScanner
+from netmon.docker_client import DEFAULT_NETWORKS
 from netmon.visualizer import NetworkVisualizer
 
 if TYPE_CHECKING:
     from netmon.alerts import AlertDispatcher
+    from netmon.conflicts import ConflictDetector, ConflictReport
+    from netmon.docker_client import DockerClient
+    from netmon.scanner import NetworkScanner, NetworkTopology
 
 
 class EventMonitor:
@@ -38,19 +39,32 @@ class EventMonitor:
         detector: ConflictDetector,
         dispatcher: AlertDispatcher | None = None,
         console: Console | None = None,
+        event_labels: list[str] | None = None,
     ) -> None:
         self._client = client
         self._scanner = scanner
         self._detector = detector
         self._dispatcher = dispatcher
         self._console = console or Console()
+        self._event_labels = event_labels
         self._visualizer = NetworkVisualizer(self._console)
         self._running = False
         self._last_scan_time = 0.0
-        self._pending_scan = False
-
-    def start(self, show_initial_scan: bool = True) -> None:
-        """Start monitoring Docker events."""
+        self._scan_task: asyncio.Task[None] | None = None
+        # Topology from the last scan, patched in place for network-level events
+        self._topology: NetworkTopology | None = None
+        self._full_scan_needed = True
+        self._dirty_networks: dict[str, str] = {}
+        self._alert_tasks: set[asyncio.Task[None]] = set()
+        # Serializes scans so a trailing and an immediate scan never interleave
+        self._scan_lock = asyncio.Lock()
+
+    async def start(self, show_initial_scan: bool = True) -> None:
+        """Start monitoring Docker events.
+
+        The Docker event stream is blocking, so each event is read on a worker
+        thread to keep the event loop free for alert delivery.
+        """
         self._running = True
         self._setup_signal_handlers()
 
@@ -61,27 +75,36 @@ class EventMonitor:
             self._console.print("[dim]Alerting is enabled[/dim]\n")
 
         if show_initial_scan:
-            self._perform_scan(initial=True)
+            await self._perform_scan(initial=True)
+
+        events = self._client.watch_events(labels=self._event_labels)
 
         try:
-            for event in self._client.watch_events():
-                if not self._running:
+            while self._running:
+                event = await asyncio.to_thread(next, events, None)
+                if event is None or not self._running:
                     break
 
                 event_type = event.get("Type", "")
                 action = event.get("Action", "")
 
                 if (event_type, action) in self.RELEVANT_EVENTS:
-                    self._handle_event(event)
+                    await self._handle_event(event)
 
         except KeyboardInterrupt:
             pass
         finally:
+            if self._scan_task is not None:
+                self._scan_task.cancel()
+            if self._alert_tasks:
+                await asyncio.gather(*self._alert_tasks, return_exceptions=True)
             self._console.print("\n[dim]Stopped monitoring[/dim]")
 
     def stop(self) -> None:
         """Stop monitoring."""
         self._running = False
+        if self._scan_task is not None:
+            self._scan_task.cancel()
 
     def _setup_signal_handlers(self) -> None:
         """Set up signal handlers for graceful shutdown."""
@@ -91,7 +114,7 @@ class EventMonitor:
         signal.signal(signal.SIGTERM, handle_signal)
         signal.signal(signal.SIGINT, handle_signal)
 
-    def _handle_event(self, event: dict) -> None:
+    async def _handle_event(self, event: dict) -> None:
         """Handle a Docker event."""
         event_type = event.get("Type", "")
         action = event.get("Action", "")
@@ -105,38 +128,96 @@ class EventMonitor:
             f"[cyan]{event_type}[/cyan]:[yellow]{action}[/yellow] {name}"
         )
 
-        now = time.time()
-        if now - self._last_scan_time >= self.DEBOUNCE_SECONDS:
-            self._perform_scan()
+        network_id = actor.get("ID")
+        network_name = attributes.get("name")
+        if event_type == "network" and network_id and network_name:
+            if network_name not in DEFAULT_NETWORKS:
+                self._dirty_networks[network_id] = network_name
         else:
-            self._pending_scan = True
-
-    def _perform_scan(self, initial: bool = False) -> None:
-        """Perform a network scan and check for conflicts."""
-        self._last_scan_time = time.time()
-        self._pending_scan = False
-
-        try:
-            topology = self._scanner.scan()
-            report = self._detector.analyze(topology)
-
-            if not initial:
-                self._console.print()
+            # Container events may touch any of the container's networks
+            self._full_scan_needed = True
 
-            self._visualizer.render_summary(report)
+        if self._scan_task is not None:
+            # A trailing scan is already scheduled and will pick this change up
+            return
 
-            if report.has_conflicts:
-                self._console.print()
-                self._visualizer.render_conflict_report(report)
-
-                if self._dispatcher and self._dispatcher.is_configured:
-                    if self._dispatcher.send_conflict_alert(report):
-                        self._console.print("[dim]Alert sent[/dim]")
-                    else:
-                        self._console.print("[red]Failed to send alert[/red]")
-
-            if not initial:
-                self._console.print()
-
-        except Exception as e:
-            self._console.print(f"[red]Scan error: {e}[/red]")
+        elapsed = time.time() - self._last_scan_time
+        if elapsed >= self.DEBOUNCE_SECONDS:
+            await self._perform_scan()
+        else:
+            self._scan_task = asyncio.create_task(
+                self._perform_scan_later(self.DEBOUNCE_SECONDS - elapsed)
+            )
+
+    async def _perform_scan_later(self, delay: float) -> None:
+        """Run a scan once the debounce window closes."""
+        await asyncio.sleep(delay)
+        self._scan_task = None
+        await self._perform_scan()
+
+    async def _perform_scan(self, initial: bool = False) -> None:
+        """Perform a network scan and check for conflicts.
+
+        Only networks named in network events are rescanned and merged into the
+        previous topology; container events trigger a full scan. The scan itself
+        runs on a worker thread so in-flight alerts keep making progress.
+        """
+        async with self._scan_lock:
+            self._last_scan_time = time.time()
+            dirty_networks, self._dirty_networks = self._dirty_networks, {}
+            full_scan = self._full_scan_needed or self._topology is None
+            self._full_scan_needed = False
+
+            try:
+                report = await asyncio.to_thread(self._scan_and_analyze, full_scan, dirty_networks)
+
+                if not initial:
+                    self._console.print()
+
+                self._visualizer.render_summary(report)
+
+                if report.has_conflicts:
+                    self._console.print()
+                    self._visualizer.render_conflict_report(report)
+
+                    if self._dispatcher and self._dispatcher.is_configured:
+                        task = asyncio.create_task(self._send_alert(report))
+                        self._alert_tasks.add(task)
+                        task.add_done_callback(self._alert_tasks.discard)
+
+                if not initial:
+                    self._console.print()
+
+            except Exception as e:
+                # The cached topology may be partially updated; rebuild it next time
+                self._topology = None
+                self._console.print(f"[red]Scan error: {e}[/red]")
+
+    def _scan_and_analyze(
+        self, full_scan: bool, dirty_networks: dict[str, str]
+    ) -> ConflictReport:
+        """Bring the cached topology up to date and analyze it.
+
+        Runs on a worker thread; the scan lock keeps it the only writer.
+        """
+        if full_scan:
+            self._topology = self._scanner.scan()
+        else:
+            for network_id, network_name in dirty_networks.items():
+                partial = self._scanner.scan_network_by_id(network_id)
+                self._topology.update_network(
+                    network_name, partial.networks.get(network_name, [])
+                )
+
+        return self._detector.analyze(self._topology)
+
+    async def _send_alert(self, report: ConflictReport) -> None:
+        """Send a conflict alert without blocking event handling."""
+        sent = await self._dispatcher.send_conflict_alert(report)
+        if sent is None:
+            return
+
+        if sent:
+            self._console.print("[dim]Alert sent[/dim]")
+        else:
+            self._console.print("[red]Failed to send alert[/red]")
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from bisect import insort
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,24 +22,32 @@ class DnsNameSource(Enum):
     ALIAS = "alias"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DnsNameEntry:
-    """A DNS name with its source."""
+    """A DNS name with its source.
+
+    name keeps the spelling from the container's configuration for display;
+    key is its lowercase form, used for matching.
+    """
 
     name: str
+    key: str
     source: DnsNameSource
     container_name: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NetworkNode:
-    """A container node in the network topology."""
+    """A container node in the network topology.
+
+    Nodes are immutable and hashable so derived data can be cached per node.
+    """
 
     container_id: str
     container_name: str
     short_id: str
     ip_address: str
-    aliases: list[str]
+    aliases: tuple[str, ...]
     service_name: str | None
     compose_project: str | None
 
@@ -44,16 +56,22 @@ class NetworkNode:
 class NetworkTopology:
     """Complete network topology of Docker environment."""
 
-    networks: dict[str, list[NetworkNode]] = field(default_factory=dict)
-    containers: dict[str, set[str]] = field(default_factory=dict)
+    networks: defaultdict[str, list[NetworkNode]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    # Container name -> networks, as an insertion-ordered dict used as an ordered set
+    containers: defaultdict[str, dict[str, None]] = field(
+        default_factory=lambda: defaultdict(dict)
+    )
+    container_ids: set[str] = field(default_factory=set)
+    # Network names in sorted order; every mutation below keeps it, and each
+    # network's nodes, in display order so renderers never need to sort
+    sorted_network_names: list[str] = field(default_factory=list)
 
     def add_container_to_network(
         self, network_name: str, container: ContainerInfo, ip_address: str, aliases: list[str]
     ) -> None:
         """Add a container to a network in the topology."""
-        if network_name not in self.networks:
-            self.networks[network_name] = []
-
         service_name = container.labels.get("com.docker.compose.service")
         compose_project = container.labels.get("com.docker.compose.project")
 
@@ -62,20 +80,51 @@ class NetworkTopology:
             container_name=container.name,
             short_id=container.short_id,
             ip_address=ip_address,
-            aliases=aliases,
+            aliases=tuple(aliases),
             service_name=service_name,
             compose_project=compose_project,
         )
 
-        self.networks[network_name].append(node)
-
-        if container.name not in self.containers:
-            self.containers[container.name] = set()
-        self.containers[container.name].add(network_name)
+        self.add_node(network_name, node)
+
+    def add_node(self, network_name: str, node: NetworkNode) -> None:
+        """Add an existing node to a network in the topology."""
+        nodes = self.networks[network_name]
+        if not nodes:
+            insort(self.sorted_network_names, network_name)
+        insort(nodes, node, key=_node_sort_key)
+        self.containers[node.container_name][network_name] = None
+        self.container_ids.add(node.container_id)
+
+    def remove_network(self, network_name: str) -> None:
+        """Remove a network and its nodes from the topology."""
+        if network_name in self.sorted_network_names:
+            self.sorted_network_names.remove(network_name)
+
+        for node in self.networks.pop(network_name, []):
+            networks = self.containers[node.container_name]
+            networks.pop(network_name, None)
+            if not networks:
+                del self.containers[node.container_name]
+                self.container_ids.discard(node.container_id)
+
+    def update_network(self, network_name: str, nodes: list[NetworkNode]) -> None:
+        """Replace a network's nodes, e.g. with the result of a partial rescan."""
+        self.remove_network(network_name)
+        for node in nodes:
+            self.add_node(network_name, node)
+
+    @property
+    def unique_container_count(self) -> int:
+        """Number of distinct containers across all networks."""
+        return len(self.container_ids)
 
     def get_networks_for_container(self, container_name: str) -> set[str]:
         """Get all networks a container is connected to."""
-        return self.containers.get(container_name, set())
+        return set(self.containers.get(container_name, ()))
+
+
+_node_sort_key = attrgetter("container_name")
 
 
 class NetworkScanner:
@@ -91,93 +140,115 @@ class NetworkScanner:
             include_default_networks: Include bridge, host, none networks
         """
         topology = NetworkTopology()
-        networks = self._client.get_networks(include_default=include_default_networks)
-
-        for network in networks:
-            for container in network.containers:
-                attachment = container.networks.get(network.name)
-                if attachment:
-                    topology.add_container_to_network(
-                        network_name=network.name,
-                        container=container,
-                        ip_address=attachment.ip_address,
-                        aliases=attachment.aliases,
-                    )
+        attachments = self._client.iter_attachments(include_default=include_default_networks)
+
+        for container, attachment in attachments:
+            topology.add_container_to_network(
+                network_name=attachment.network_name,
+                container=container,
+                ip_address=attachment.ip_address,
+                aliases=attachment.aliases,
+            )
 
         return topology
 
     def scan_network(self, network_name: str) -> NetworkTopology:
-        """Scan a specific network."""
+        """Scan a specific network by name."""
+        return self._scan_single_network(network_name)
+
+    def scan_network_by_id(self, network_id: str) -> NetworkTopology:
+        """Scan a specific network by ID."""
+        return self._scan_single_network(network_id)
+
+    def _scan_single_network(self, network_ref: str) -> NetworkTopology:
+        """Scan one network, given its name or ID.
+
+        The network is looked up directly by the daemon, so only that
+        network's containers are fetched rather than every network's.
+        """
         topology = NetworkTopology()
-        networks = self._client.get_networks(include_default=True)
-
-        for network in networks:
-            if network.name == network_name:
-                for container in network.containers:
-                    attachment = container.networks.get(network.name)
-                    if attachment:
-                        topology.add_container_to_network(
-                            network_name=network.name,
-                            container=container,
-                            ip_address=attachment.ip_address,
-                            aliases=attachment.aliases,
-                        )
-                break
+        network = self._client.get_network(network_ref)
 
-        return topology
+        if network:
+            self._add_network(topology, network)
 
+        return topology
 
-def get_all_dns_names(node: NetworkNode) -> list[str]:
+    def _add_network(self, topology: NetworkTopology, network: NetworkInfo) -> None:
+        """Add a network's attached containers to the topology."""
+        for container in network.containers:
+            attachment = container.networks.get(network.name)
+            if attachment:
+                topology.add_container_to_network(
+                    network_name=network.name,
+                    container=container,
+                    ip_address=attachment.ip_address,
+                    aliases=attachment.aliases,
+                )
+
+
+@lru_cache(maxsize=4096)
+def get_all_dns_names(node: NetworkNode) -> tuple[str, ...]:
     """Get all DNS names that can resolve to this container on a network.
 
     Docker DNS resolves:
     - Container name
     - Service name (if in compose)
     - Explicit network aliases
-    """
-    names = [node.container_name]
-
-    if node.service_name:
-        names.append(node.service_name)
-
-    names.extend(node.aliases)
 
-    return list(set(names))
+    Docker's embedded DNS matches names case-insensitively, so names are
+    returned in lowercase canonical form, in the same order as
+    get_dns_name_entries(). Results are cached per node.
+    """
+    return tuple(entry.key for entry in get_dns_name_entries(node))
 
 
-def get_dns_name_entries(node: NetworkNode) -> list[DnsNameEntry]:
+@lru_cache(maxsize=4096)
+def get_dns_name_entries(node: NetworkNode) -> tuple[DnsNameEntry, ...]:
     """Get all DNS names with their sources for a container.
 
     Returns detailed information about each DNS name including its source type.
+    Names keep their original spelling; each entry's key is the lowercase
+    form returned by get_all_dns_names(), and duplicates are removed by key.
+
+    Results are cached by node value, so unchanged containers are not
+    re-processed on every scan in watch mode.
     """
     entries = []
     seen_names = set()
 
     # Container name is always a DNS name
+    container_dns_name = node.container_name.lower()
     entries.append(DnsNameEntry(
         name=node.container_name,
+        key=container_dns_name,
         source=DnsNameSource.CONTAINER_NAME,
         container_name=node.container_name,
     ))
-    seen_names.add(node.container_name)
+    seen_names.add(container_dns_name)
 
     # Service name (from docker-compose)
-    if node.service_name and node.service_name not in seen_names:
-        entries.append(DnsNameEntry(
-            name=node.service_name,
-            source=DnsNameSource.SERVICE_NAME,
-            container_name=node.container_name,
-        ))
-        seen_names.add(node.service_name)
+    if node.service_name:
+        service_dns_name = node.service_name.lower()
+        if service_dns_name not in seen_names:
+            entries.append(DnsNameEntry(
+                name=node.service_name,
+                key=service_dns_name,
+                source=DnsNameSource.SERVICE_NAME,
+                container_name=node.container_name,
+            ))
+            seen_names.add(service_dns_name)
 
     # Explicit network aliases
     for alias in node.aliases:
-        if alias not in seen_names:
+        alias_dns_name = alias.lower()
+        if alias_dns_name not in seen_names:
             entries.append(DnsNameEntry(
                 name=alias,
+                key=alias_dns_name,
                 source=DnsNameSource.ALIAS,
                 container_name=node.container_name,
             ))
-            seen_names.add(alias)
+            seen_names.add(alias_dns_name)
 
-    return entries
+    return tuple(entries)
@@ -2,14 +2,43 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from flask import Flask, jsonify, render_template
+from flask import Flask, Response, current_app, jsonify, render_template, request
 
-from netmon.conflicts import ConflictDetector, Severity
+from netmon.conflicts import ConflictDetector
 from netmon.docker_client import DockerClient
-from netmon.scanner import NetworkScanner, get_dns_name_entries
+from netmon.scanner import NetworkScanner, get_all_dns_names, get_dns_name_entries
+
+if TYPE_CHECKING:
+    from netmon.conflicts import ConflictReport
+    from netmon.scanner import NetworkTopology
+
+
+# Scans younger than this are served from cache; the dashboard polls every few
+# seconds and concurrent tabs would otherwise each trigger a full scan
+SCAN_CACHE_TTL = 2.0
+
+
+@dataclass(slots=True)
+class _ScanResult:
+    """A scan with its analysis and serialized API payload."""
+
+    timestamp: float
+    fingerprint: str
+    topology: NetworkTopology
+    report: ConflictReport
+    payload: str
+
+
+# Shared across request threads; guarded by _scan_lock
+_client: DockerClient | None = None
+_last_scan: _ScanResult | None = None
+_scan_lock = threading.Lock()
 
 
 def create_app() -> Flask:
@@ -23,104 +52,149 @@ def create_app() -> Flask:
         static_folder=str(static_dir),
     )
 
+    # Skip key sorting and ASCII escaping, and always emit compact output
+    app.json.sort_keys = False
+    app.json.ensure_ascii = False
+    app.json.compact = True
+
     @app.route("/")
     def dashboard() -> str:
         """Render the main dashboard."""
         return render_template("dashboard.html")
 
     @app.route("/api/conflicts")
-    def api_conflicts() -> tuple[Any, int]:
-        """Return conflict report as JSON."""
-        try:
-            client = DockerClient()
-            scanner = NetworkScanner(client)
-            detector = ConflictDetector()
-
-            topology = scanner.scan()
-            report = detector.analyze(topology)
-
-            conflicts = []
-            for conflict in report.conflicts:
-                conflicting_names = [
-                    {"container": cn.container_name, "source": cn.source}
-                    for cn in conflict.conflicting_names
-                ]
-                conflicts.append({
-                    "network": conflict.network,
-                    "dns_name": conflict.dns_name,
-                    "severity": conflict.severity.value,
-                    "containers": conflict.container_names,
-                    "description": conflict.description,
-                    "remediation": conflict.remediation,
-                    "conflicting_names": conflicting_names,
-                })
-
-            tree_data = _build_tree_data(topology, report)
-
-            client.close()
-
-            return jsonify({
-                "summary": {
-                    "total_networks": report.total_networks,
-                    "total_containers": report.total_containers,
-                    "total_conflicts": len(report.conflicts),
-                    "critical_count": report.critical_count,
-                    "high_count": report.high_count,
-                    "warning_count": report.warning_count,
-                },
-                "conflicts": conflicts,
-                "tree": tree_data,
-            }), 200
+    def api_conflicts() -> Response | tuple[Any, int]:
+        """Return conflict report as JSON.
 
+        The topology fingerprint is sent as an ETag, so polling clients get
+        a 304 with no body while nothing has changed.
+        """
+        try:
+            result = _cached_scan()
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
+        response = Response(result.payload, mimetype="application/json")
+        response.set_etag(result.fingerprint)
+        return response.make_conditional(request)
+
     return app
 
 
-def _build_conflict_lookup(report) -> dict[tuple[str, str], Severity]:
-    """Build a lookup of (network, dns_name) -> severity."""
-    lookup = {}
-    for conflict in report.conflicts:
-        key = (conflict.network, conflict.dns_name)
-        if key not in lookup or _severity_order(conflict.severity) < _severity_order(lookup[key]):
-            lookup[key] = conflict.severity
-    return lookup
+def _cached_scan(ttl: float = SCAN_CACHE_TTL) -> _ScanResult:
+    """Return the latest scan, rescanning if it is older than ttl seconds.
+
+    The Docker client is created once and reused. Requests arriving while a
+    scan is running wait for it and share its result. If a rescan finds the
+    topology unchanged, the previous analysis and payload are kept.
+    """
+    global _client, _last_scan
+
+    with _scan_lock:
+        now = time.monotonic()
+        if _last_scan is not None and now - _last_scan.timestamp < ttl:
+            return _last_scan
 
+        if _client is None:
+            _client = DockerClient()
+
+        try:
+            topology = NetworkScanner(_client).scan()
+        except Exception:
+            # The connection may be broken; reconnect on the next request
+            _client.close()
+            _client = None
+            raise
+
+        fingerprint = _topology_fingerprint(topology)
+        if _last_scan is not None and _last_scan.fingerprint == fingerprint:
+            _last_scan.timestamp = now
+            return _last_scan
+
+        report = ConflictDetector().analyze(topology)
+        payload = current_app.json.dumps(_build_payload(topology, report), separators=(",", ":"))
+
+        _last_scan = _ScanResult(
+            timestamp=now,
+            fingerprint=fingerprint,
+            topology=topology,
+            report=report,
+            payload=payload,
+        )
+        return _last_scan
+
+
+def _topology_fingerprint(topology: NetworkTopology) -> str:
+    """Hash everything in a topology that the API payload is derived from.
+
+    Nodes are hashable and already in display order after a scan, so
+    equal topologies produce equal fingerprints within a process.
+    """
+    state = tuple(
+        (network_name, tuple(topology.networks[network_name]))
+        for network_name in topology.sorted_network_names
+    )
+    return format(hash(state) & 0xFFFFFFFFFFFFFFFF, "016x")
+
+
+def _build_payload(topology: NetworkTopology, report: ConflictReport) -> dict[str, Any]:
+    """Build the /api/conflicts response body."""
+    conflicts = []
+    for conflict in report.conflicts:
+        conflicting_names = [
+            {"container": cn.container_name, "source": cn.source}
+            for cn in conflict.conflicting_names
+        ]
+        conflicts.append({
+            "network": conflict.network,
+            "dns_name": conflict.dns_name,
+            "severity": conflict.severity.label,
+            "containers": conflict.container_names,
+            "description": conflict.description,
+            "remediation": conflict.remediation,
+            "conflicting_names": conflicting_names,
+        })
 
-def _severity_order(severity: Severity) -> int:
-    """Return sort order for severity (lower = more severe)."""
     return {
-        Severity.CRITICAL: 0,
-        Severity.HIGH: 1,
-        Severity.WARNING: 2,
-    }.get(severity, 3)
+        "summary": {
+            "total_networks": report.total_networks,
+            "total_containers": report.total_containers,
+            "total_conflicts": len(report.conflicts),
+            "critical_count": report.critical_count,
+            "high_count": report.high_count,
+            "warning_count": report.warning_count,
+        },
+        "conflicts": conflicts,
+        "tree": _build_tree_data(topology, report),
+    }
 
 
 def _build_tree_data(topology, report) -> list[dict]:
     """Build tree structure for HTML tree view."""
-    conflict_lookup = _build_conflict_lookup(report)
+    conflict_lookup = report.conflict_lookup
     tree = []
 
-    for network_name in sorted(topology.networks.keys()):
-        nodes = topology.networks[network_name]
+    for network_name in topology.sorted_network_names:
         network_data = {
             "name": network_name,
             "type": "network",
             "containers": [],
         }
+        network_conflicts = conflict_lookup.get(network_name, {})
+        conflict_names = network_conflicts.keys()
 
-        for container in sorted(nodes, key=lambda n: n.container_name):
-            dns_entries = get_dns_name_entries(container)
+        for container in topology.networks[network_name]:
             conflicts = []
-            for entry in dns_entries:
-                key = (network_name, entry.name)
-                if key in conflict_lookup:
-                    conflicts.append({
-                        "name": entry.name,
-                        "severity": conflict_lookup[key].value,
-                        "source": entry.source.value,
-                    })
+            # Most containers have no conflicting names; one set test skips them
+            if not conflict_names.isdisjoint(get_all_dns_names(container)):
+                for entry in get_dns_name_entries(container):
+                    conflict = network_conflicts.get(entry.key)
+                    if conflict is not None:
+                        conflicts.append({
+                            "name": entry.name,
+                            "severity": conflict.severity.label,
+                            "source": entry.source.value,
+                        })
 
             container_data = {
                 "name": container.container_name,
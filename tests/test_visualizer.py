@@ -0,0 +1,83 @@
+"""Tests for topology rendering."""
+
+from __future__ import annotations
+
+import io
+
+from rich.console import Console
+
+from netmon.conflicts import ConflictDetector
+from netmon.scanner import NetworkNode, NetworkTopology
+from netmon.visualizer import NetworkVisualizer
+from netmon.web import _build_tree_data
+
+
+def make_node(container_id: str, name: str, aliases: tuple[str, ...] = ()) -> NetworkNode:
+    return NetworkNode(
+        container_id=container_id,
+        container_name=name,
+        short_id=container_id[:12],
+        ip_address="",
+        aliases=aliases,
+        service_name=None,
+        compose_project=None,
+    )
+
+
+def render(topology: NetworkTopology) -> str:
+    output = io.StringIO()
+    visualizer = NetworkVisualizer(Console(file=output, width=120, color_system=None))
+    visualizer.render_topology(topology, ConflictDetector().analyze(topology))
+    return output.getvalue()
+
+
+def test_hand_built_topology_renders_in_sorted_order() -> None:
+    topology = NetworkTopology()
+    topology.add_node("zeta", make_node("c1", "worker"))
+    topology.add_node("alpha", make_node("c2", "web"))
+    topology.add_node("alpha", make_node("c3", "api"))
+
+    rendered = render(topology)
+
+    assert rendered.index("alpha") < rendered.index("zeta")
+    assert rendered.index("api") < rendered.index("web")
+    assert "worker" in rendered
+
+
+def test_network_added_after_render_is_shown() -> None:
+    topology = NetworkTopology()
+    topology.add_node("net", make_node("c1", "one"))
+    render(topology)
+
+    topology.add_node("net2", make_node("c2", "two"))
+
+    rendered = render(topology)
+    assert "net2" in rendered
+    assert "two" in rendered
+
+
+def test_removed_network_is_not_shown() -> None:
+    topology = NetworkTopology()
+    topology.add_node("keep", make_node("c1", "one"))
+    topology.add_node("drop", make_node("c2", "two"))
+
+    topology.update_network("drop", [])
+
+    assert topology.sorted_network_names == ["keep"]
+    assert "drop" not in render(topology)
+
+
+def test_tree_data_matches_analyzed_networks() -> None:
+    topology = NetworkTopology()
+    topology.add_node("shared", make_node("c1", "app1", aliases=("db",)))
+    topology.add_node("shared", make_node("c2", "app2", aliases=("db",)))
+    topology.add_node("other", make_node("c3", "solo"))
+    report = ConflictDetector().analyze(topology)
+
+    tree = _build_tree_data(topology, report)
+
+    assert [network["name"] for network in tree] == ["other", "shared"]
+    assert len(tree) == report.total_networks
+    shared = tree[1]["containers"]
+    assert [c["name"] for c in shared] == ["app1", "app2"]
+    assert all(c["conflicts"][0]["name"] == "db" for c in shared)